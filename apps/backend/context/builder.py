@@ -7,7 +7,6 @@ Main builder class that orchestrates context building for tasks.
 
 import asyncio
 import json
-from dataclasses import asdict
 from pathlib import Path
 
 from .categorizer import FileCategorizer
@@ -160,10 +159,11 @@ class ContextBuilder:
             task_description=task,
             scoped_services=services,
             files_to_modify=[
-                asdict(f) if isinstance(f, FileMatch) else f for f in files_to_modify
+                f.to_dict() if isinstance(f, FileMatch) else f for f in files_to_modify
             ],
             files_to_reference=[
-                asdict(f) if isinstance(f, FileMatch) else f for f in files_to_reference
+                f.to_dict() if isinstance(f, FileMatch) else f
+                for f in files_to_reference
             ],
             patterns_discovered=patterns,
             service_contexts=service_contexts,
@@ -242,10 +242,11 @@ class ContextBuilder:
             task_description=task,
             scoped_services=services,
             files_to_modify=[
-                asdict(f) if isinstance(f, FileMatch) else f for f in files_to_modify
+                f.to_dict() if isinstance(f, FileMatch) else f for f in files_to_modify
             ],
             files_to_reference=[
-                asdict(f) if isinstance(f, FileMatch) else f for f in files_to_reference
+                f.to_dict() if isinstance(f, FileMatch) else f
+                for f in files_to_reference
             ],
             patterns_discovered=patterns,
             service_contexts=service_contexts,
@@ -5,21 +5,42 @@ Data Models for Task Context
 Core data structures for representing file matches and task context.
 """
 
+from array import array
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class FileMatch:
-    """A file that matched the search criteria."""
+    """A file that matched the search criteria.
+
+    Matching lines are stored as parallel sequences: line numbers in a
+    compact int array and the line texts in a list at the same index.
+    """
 
     path: str
     service: str
     reason: str
     relevance_score: float = 0.0
-    matching_lines: list[tuple[int, str]] = field(default_factory=list)
+    line_numbers: "array[int]" = field(default_factory=lambda: array("i"))
+    line_texts: list[str] = field(default_factory=list)
+
+    @property
+    def matching_lines(self) -> list[tuple[int, str]]:
+        """Matching lines as (line_number, text) pairs."""
+        return list(zip(self.line_numbers, self.line_texts))
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return {
+            "path": self.path,
+            "service": self.service,
+            "reason": self.reason,
+            "relevance_score": self.relevance_score,
+            "matching_lines": self.matching_lines,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiRepoContext:
     """Context for multi-repository workspaces.
 
@@ -31,14 +52,30 @@ class MultiRepoContext:
     dependencies: dict[str, list[str]] = field(default_factory=dict)
     cross_repo_patterns: dict[str, dict] = field(default_factory=dict)
     worktree_strategy: dict[str, str] = field(default_factory=dict)
+    # Lazily built reverse index of `dependencies` (repo -> dependent repos).
+    # `dependencies` is treated as read-only after construction; callers that
+    # do modify it must call invalidate_dependency_index() afterwards.
+    _reverse_deps: dict[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _build_reverse(self) -> None:
+        """Build the reverse dependency index in a single pass."""
+        reverse: dict[str, list[str]] = {}
+        for repo, deps in self.dependencies.items():
+            for dep in dict.fromkeys(deps):
+                reverse.setdefault(dep, []).append(repo)
+        self._reverse_deps = reverse
+
+    def invalidate_dependency_index(self) -> None:
+        """Force the reverse dependency index to be rebuilt on next query."""
+        self._reverse_deps = None
 
     def get_dependent_repos(self, repo_name: str) -> list[str]:
         """Get repos that depend on the given repo."""
-        dependents = []
-        for repo, deps in self.dependencies.items():
-            if repo_name in deps:
-                dependents.append(repo)
-        return dependents
+        if self._reverse_deps is None:
+            self._build_reverse()
+        return list(self._reverse_deps.get(repo_name, []))
 
     def get_cross_repo_impact(self, repo_name: str) -> list[dict]:
         """Get cross-repo patterns that involve the given repo."""
@@ -49,7 +86,7 @@ class MultiRepoContext:
         return impacts
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """Complete context for a task."""
 
@@ -5,6 +5,7 @@ Code Search Functionality
 Search codebase for relevant files based on keywords.
 """
 
+from array import array
 from pathlib import Path
 
 from .constants import CODE_EXTENSIONS, SKIP_DIRS
@@ -47,7 +48,8 @@ class CodeSearcher:
                 # Score this file
                 score = 0
                 matching_keywords = []
-                matching_lines = []
+                line_numbers = []
+                line_texts = []
 
                 for keyword in keywords:
                     if keyword in content_lower:
@@ -61,7 +63,8 @@ class CodeSearcher:
                         found = 0
                         for i, line in enumerate(lines, 1):
                             if keyword in line.lower() and found < 3:
-                                matching_lines.append((i, line.strip()[:100]))
+                                line_numbers.append(i)
+                                line_texts.append(line.strip()[:100])
                                 found += 1
 
                 if score > 0:
@@ -72,7 +75,9 @@ class CodeSearcher:
                             service=service_name,
                             reason=f"Contains: {', '.join(matching_keywords)}",
                             relevance_score=score,
-                            matching_lines=matching_lines[:5],  # Top 5 lines
+                            # Top 5 lines
+                            line_numbers=array("i", line_numbers[:5]),
+                            line_texts=line_texts[:5],
                         )
                     )
 
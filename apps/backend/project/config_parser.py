@@ -7,7 +7,9 @@ Utilities for reading and parsing project configuration files
 """
 
 import json
+import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 # tomllib is available in Python 3.11+, use tomli for older versions
@@ -22,6 +24,13 @@ else:
             "Install with: pip install tomli"
         ) from None
 
+# Parsed config files shared by every ConfigParser in the process:
+# path -> ((mtime_ns, size), parsed data). Detectors create a fresh parser per
+# call, so a process-level cache is what lets repeated analyses of a project
+# skip re-parsing unchanged manifests. An edited file fails the stamp check
+# and replaces its entry.
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+
 
 class ConfigParser:
     """Parses project configuration files."""
@@ -35,19 +44,39 @@ class ConfigParser:
         """
         self.project_dir = Path(project_dir).resolve()
 
+    def _read_cached(self, filename: str, parse: Callable[[bytes], dict]) -> dict:
+        """
+        Read and parse a file, reusing the previous result if it is unchanged.
+
+        The whole file is read into memory before parsing. The result is
+        shared with other parsers, so callers must not mutate it. Raises
+        FileNotFoundError if the file does not exist; parse errors propagate.
+        """
+        path = self.project_dir / filename
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = str(path)
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        data = parse(path.read_bytes())
+        _PARSE_CACHE[key] = (stamp, data)
+        return data
+
     def read_json(self, filename: str) -> dict | None:
         """Read a JSON file from project root."""
         try:
-            with open(self.project_dir / filename, encoding="utf-8") as f:
-                return json.load(f)
+            return self._read_cached(filename, json.loads)
         except (FileNotFoundError, json.JSONDecodeError):
             return None
 
     def read_toml(self, filename: str) -> dict | None:
         """Read a TOML file from project root."""
         try:
-            with open(self.project_dir / filename, "rb") as f:
-                return tomllib.load(f)
+            return self._read_cached(
+                filename, lambda raw: tomllib.loads(raw.decode("utf-8"))
+            )
         except FileNotFoundError:
             return None
         except Exception as e:
@@ -79,3 +108,23 @@ class ConfigParser:
     def glob_files(self, pattern: str) -> list[Path]:
         """Find files matching a pattern."""
         return list(self.project_dir.glob(pattern))
+
+    def glob_files_multi(self, suffixes: tuple[str, ...]) -> list[str]:
+        """
+        Find names of entries in project root ending with any of the suffixes.
+
+        Equivalent to one non-recursive glob per suffix, but lists the
+        directory only once and returns bare names without building Path
+        objects. Names are returned in directory order. Matching follows the
+        platform's case rules like Path.glob (case-insensitive on Windows).
+        """
+        suffixes = tuple(os.path.normcase(suffix) for suffix in suffixes)
+        try:
+            with os.scandir(self.project_dir) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if os.path.normcase(entry.name).endswith(suffixes)
+                ]
+        except OSError:
+            return []
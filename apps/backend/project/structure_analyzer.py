@@ -7,13 +7,104 @@ Makefile targets, Poetry scripts, shell scripts) and custom
 command allowlists.
 """
 
+import codecs
 import json
 import re
+import sys
 from pathlib import Path
 
 from .config_parser import ConfigParser
 from .models import CustomScripts
 
+# orjson is optional - when installed it parses security defaults faster.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so error handling is
+# the same for both parsers.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# msgspec is optional - when installed, well-formed security defaults are
+# decoded straight into typed structs instead of nested dicts.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+
+    class _SecScripts(msgspec.Struct):
+        make_targets: list[str] = []
+        mise_tasks: list[str] = []
+
+    class _SecDefaults(msgspec.Struct):
+        custom_scripts: _SecScripts = msgspec.field(default_factory=_SecScripts)
+        validation_commands: dict[str, dict[str, str]] = {}
+
+
+# Line scanners. Each file type has its own pattern rather than one combined
+# alternation: the files are scanned separately anyway, and a shared pattern
+# would misread allowlist entries containing ":" as Makefile targets.
+
+# Makefile target definitions like "target:" or "target: deps", matched
+# across the whole file at once. Dotted internal targets (.PHONY etc.)
+# are rejected by the pattern itself.
+_MAKE_TARGET_RE = re.compile(r"(?m)^(?!\.)([A-Za-z_][A-Za-z0-9_-]*)[ \t]*:")
+
+# Non-empty, non-comment allowlist lines with surrounding whitespace stripped.
+# The pattern only splits on "\n", so every other str.splitlines() boundary is
+# mapped to "\n" first; together they match the old strip()/splitlines() loop.
+_ALLOWLIST_RE = re.compile(r"(?m)^[^\S\n]*([^\s#][^\n]*?)[^\S\n]*$")
+_LINE_BREAKS = str.maketrans(
+    dict.fromkeys("\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029", "\n")
+)
+
+# First whitespace-delimited word of a command line (same as cmd.split()[0])
+_COMMAND_HEAD_RE = re.compile(r"\S+")
+
+# Decoded security_defaults.json files: path -> ((mtime_ns, size), decoded).
+# Reuses the parse across repeated analyses of the same project; an edited
+# file fails the stamp check and replaces its entry.
+_SEC_DEFAULTS_CACHE: dict[str, tuple[tuple[int, int], tuple[list, list, dict]]] = {}
+
+
+def _decode_security_defaults(raw: bytes) -> tuple[list, list, dict]:
+    """
+    Decode security_defaults.json content.
+
+    Returns:
+        Tuple of (make_targets, mise_tasks, validation_commands)
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    # Accept a UTF-8 BOM (common from Windows editors) on every decoder path;
+    # orjson and msgspec reject it while json.loads(bytes) skips it
+    raw = raw.removeprefix(codecs.BOM_UTF8)
+
+    if msgspec is not None:
+        try:
+            defaults = msgspec.json.decode(raw, type=_SecDefaults)
+            return (
+                defaults.custom_scripts.make_targets,
+                defaults.custom_scripts.mise_tasks,
+                defaults.validation_commands,
+            )
+        except msgspec.DecodeError:
+            # Unexpected shape (or invalid JSON) - fall through to the
+            # lenient untyped path, which skips malformed entries
+            pass
+
+    data = _json_loads(raw)
+    custom_scripts = data.get("custom_scripts", {})
+    return (
+        custom_scripts.get("make_targets", []),
+        custom_scripts.get("mise_tasks", []),
+        data.get("validation_commands", {}),
+    )
+
 
 class StructureAnalyzer:
     """Analyzes project structure for custom scripts."""
@@ -59,29 +150,17 @@ class StructureAnalyzer:
             self.custom_scripts.npm_scripts = list(pkg["scripts"].keys())
 
             # Add commands to run these scripts
-            for script in self.custom_scripts.npm_scripts:
-                self.script_commands.add("npm")
-                self.script_commands.add("yarn")
-                self.script_commands.add("pnpm")
-                self.script_commands.add("bun")
+            if self.custom_scripts.npm_scripts:
+                self.script_commands.update(("npm", "yarn", "pnpm", "bun"))
 
     def _detect_makefile_targets(self) -> None:
         """Detect Makefile targets."""
-        if not self.parser.file_exists("Makefile"):
-            return
-
+        # read_text returns None for a missing file - no separate exists check
         content = self.parser.read_text("Makefile")
         if not content:
             return
 
-        for line in content.splitlines():
-            # Match target definitions like "target:" or "target: deps"
-            match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:", line)
-            if match:
-                target = match.group(1)
-                # Skip common internal targets
-                if not target.startswith("."):
-                    self.custom_scripts.make_targets.append(target)
+        self.custom_scripts.make_targets.extend(_MAKE_TARGET_RE.findall(content))
 
         if self.custom_scripts.make_targets:
             self.script_commands.add("make")
@@ -105,12 +184,10 @@ class StructureAnalyzer:
 
     def _detect_shell_scripts(self) -> None:
         """Detect shell scripts in root directory."""
-        for ext in ["*.sh", "*.bash"]:
-            for script_path in self.parser.glob_files(ext):
-                script_name = script_path.name
-                self.custom_scripts.shell_scripts.append(script_name)
-                # Allow executing these scripts
-                self.script_commands.add(f"./{script_name}")
+        for script_name in self.parser.glob_files_multi((".sh", ".bash")):
+            self.custom_scripts.shell_scripts.append(script_name)
+            # Allow executing these scripts
+            self.script_commands.add(f"./{script_name}")
 
     def load_custom_allowlist(self) -> None:
         """Load user-defined custom allowlist."""
@@ -118,11 +195,8 @@ class StructureAnalyzer:
         if not content:
             return
 
-        for line in content.splitlines():
-            line = line.strip()
-            # Skip comments and empty lines
-            if line and not line.startswith("#"):
-                self.custom_commands.add(line)
+        content = content.translate(_LINE_BREAKS)
+        self.custom_commands.update(m.group(1) for m in _ALLOWLIST_RE.finditer(content))
 
     def _load_security_defaults(self) -> None:
         """
@@ -144,41 +218,49 @@ class StructureAnalyzer:
         }
         """
         defaults_path = self.project_dir / ".auto-claude" / "security_defaults.json"
-        if not defaults_path.exists():
-            return
-
         try:
-            with open(defaults_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError):
+            st = defaults_path.stat()
+        except OSError:
             return
 
-        # Load custom scripts section
-        custom_scripts = data.get("custom_scripts", {})
+        key = str(defaults_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _SEC_DEFAULTS_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            defaults = cached[1]
+        else:
+            try:
+                defaults = _decode_security_defaults(defaults_path.read_bytes())
+            except (OSError, json.JSONDecodeError):
+                return
+            _SEC_DEFAULTS_CACHE[key] = (stamp, defaults)
+        make_targets, mise_tasks, validation_commands = defaults
 
         # Add make targets from defaults
-        make_targets = custom_scripts.get("make_targets", [])
+        existing = set(self.custom_scripts.make_targets)
         for target in make_targets:
-            if target not in self.custom_scripts.make_targets:
+            if target not in existing:
+                existing.add(target)
                 self.custom_scripts.make_targets.append(target)
         if make_targets:
             self.script_commands.add("make")
 
         # Add mise tasks from defaults
-        mise_tasks = custom_scripts.get("mise_tasks", [])
+        existing = set(self.custom_scripts.mise_tasks)
         for task in mise_tasks:
-            if task not in self.custom_scripts.mise_tasks:
+            if task not in existing:
+                existing.add(task)
                 self.custom_scripts.mise_tasks.append(task)
         if mise_tasks:
             self.script_commands.add("mise")
 
-        # Load validation commands as custom commands
-        validation_commands = data.get("validation_commands", {})
-        for _category, commands in validation_commands.items():
-            if isinstance(commands, dict):
-                for cmd in commands.values():
-                    if isinstance(cmd, str):
-                        # Extract base command (first word)
-                        base_cmd = cmd.split()[0] if cmd else ""
-                        if base_cmd:
-                            self.custom_commands.add(base_cmd)
+        # Load validation commands as custom commands (first word of each)
+        # Heads are interned so analyzers that see the same base command
+        # (e.g. "go", "npm") share one string object in their command sets.
+        self.custom_commands.update(
+            sys.intern(match.group())
+            for commands in validation_commands.values()
+            if isinstance(commands, dict)
+            for cmd in commands.values()
+            if isinstance(cmd, str) and (match := _COMMAND_HEAD_RE.search(cmd))
+        )
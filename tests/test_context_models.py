@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Context Models
+=============================
+
+Tests the context/models.py data structures:
+- MultiRepoContext dependency lookups
+- FileMatch serialization of CodeSearcher results
+"""
+
+import json
+from array import array
+from pathlib import Path
+
+from context.models import FileMatch, MultiRepoContext
+from context.search import CodeSearcher
+
+
+class TestMultiRepoContextDependents:
+    """Tests for MultiRepoContext.get_dependent_repos."""
+
+    def test_returns_dependents_in_repo_order(self):
+        """Repos depending on the target are returned in mapping order."""
+        ctx = MultiRepoContext(
+            dependencies={"web": ["api", "lib"], "api": ["lib"], "cli": []}
+        )
+
+        assert ctx.get_dependent_repos("lib") == ["web", "api"]
+        assert ctx.get_dependent_repos("api") == ["web"]
+
+    def test_duplicate_deps_listed_once(self):
+        """A repo listing the same dependency twice appears only once."""
+        ctx = MultiRepoContext(dependencies={"api": ["lib", "lib"]})
+
+        assert ctx.get_dependent_repos("lib") == ["api"]
+
+    def test_unknown_repo_has_no_dependents(self):
+        """Repos nobody depends on (or unknown names) yield an empty list."""
+        ctx = MultiRepoContext(dependencies={"web": ["api"]})
+
+        assert ctx.get_dependent_repos("web") == []
+        assert ctx.get_dependent_repos("missing") == []
+
+    def test_returned_list_is_a_copy(self):
+        """Mutating a result does not affect later queries."""
+        ctx = MultiRepoContext(dependencies={"web": ["api"]})
+
+        ctx.get_dependent_repos("api").append("intruder")
+
+        assert ctx.get_dependent_repos("api") == ["web"]
+
+    def test_invalidate_after_changing_dependencies(self):
+        """Changes to dependencies are seen after invalidation."""
+        ctx = MultiRepoContext(dependencies={"a": ["b"], "c": ["b"]})
+        assert ctx.get_dependent_repos("b") == ["a", "c"]
+
+        ctx.dependencies["a"] = ["x"]
+        ctx.invalidate_dependency_index()
+
+        assert ctx.get_dependent_repos("b") == ["c"]
+        assert ctx.get_dependent_repos("x") == ["a"]
+
+
+class TestFileMatchSerialization:
+    """Tests for FileMatch.to_dict on search results."""
+
+    def test_search_result_serializes_with_matching_line_pairs(self, temp_dir: Path):
+        """to_dict output is JSON-serializable and keeps [[line, text], ...]."""
+        service_dir = temp_dir / "auth"
+        service_dir.mkdir()
+        (service_dir / "login.py").write_text(
+            "def login():\n"
+            "    token = make_token()\n"
+            "    return login_user(token)\n"
+            "# login helpers\n"
+            "def make_token():\n"
+            "    return token_factory()\n"
+            "LOGIN_TOKEN_TTL = 60\n"
+        )
+
+        matches = CodeSearcher(temp_dir).search_service(
+            service_dir, "auth", ["login", "token"]
+        )
+
+        assert len(matches) == 1
+        data = json.loads(json.dumps(matches[0].to_dict()))
+        assert data == {
+            "path": str(Path("auth") / "login.py"),
+            "service": "auth",
+            "reason": "Contains: login, token",
+            "relevance_score": matches[0].relevance_score,
+            # First 3 lines per keyword, capped at 5 overall
+            "matching_lines": [
+                [1, "def login():"],
+                [3, "return login_user(token)"],
+                [4, "# login helpers"],
+                [2, "token = make_token()"],
+                [3, "return login_user(token)"],
+            ],
+        }
+
+    def test_matching_lines_property_pairs_parallel_fields(self):
+        """matching_lines zips line numbers with their texts."""
+        match = FileMatch(
+            path="a.py",
+            service="svc",
+            reason="r",
+            line_numbers=array("i", [3, 7]),
+            line_texts=["first", "second"],
+        )
+
+        assert match.matching_lines == [(3, "first"), (7, "second")]
+        assert FileMatch(path="b.py", service="svc", reason="r").matching_lines == []
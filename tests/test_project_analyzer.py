@@ -12,9 +12,15 @@ Tests the project_analyzer.py module functionality including:
 - Profile caching
 """
 
+import codecs
 import json
+import ntpath
 from pathlib import Path
 
+import pytest
+from project import config_parser, structure_analyzer
+from project.config_parser import ConfigParser
+from project.structure_analyzer import _SEC_DEFAULTS_CACHE, StructureAnalyzer
 from project_analyzer import (
     BASE_COMMANDS,
     CustomScripts,
@@ -418,6 +424,24 @@ test:
         assert "build" in analyzer.profile.custom_scripts.make_targets
         assert "test" in analyzer.profile.custom_scripts.make_targets
 
+    def test_makefile_targets_skip_internal_and_recipe_lines(self, temp_dir: Path):
+        """Dotted targets and indented recipe lines are not targets."""
+        makefile = """.PHONY: all lint
+.DEFAULT_GOAL := all
+
+all: lint
+\tcheck: this is a recipe line
+
+lint :
+\truff check .
+"""
+        (temp_dir / "Makefile").write_text(makefile)
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._detect_custom_scripts()
+
+        assert analyzer.profile.custom_scripts.make_targets == ["all", "lint"]
+
     def test_detects_shell_scripts(self, temp_dir: Path):
         """Detects shell scripts in root."""
         (temp_dir / "setup.sh").write_text("#!/bin/bash\necho 'setup'")
@@ -429,6 +453,33 @@ test:
         assert "setup.sh" in analyzer.profile.custom_scripts.shell_scripts
         assert "deploy.sh" in analyzer.profile.custom_scripts.shell_scripts
 
+    def test_detects_bash_scripts_only_by_suffix(self, temp_dir: Path):
+        """Both .sh and .bash scripts are found; other files are not."""
+        (temp_dir / "build.sh").write_text("#!/bin/sh\n")
+        (temp_dir / "env.bash").write_text("#!/bin/bash\n")
+        (temp_dir / "notes.shell.txt").write_text("not a script")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._detect_custom_scripts()
+
+        assert sorted(analyzer.profile.custom_scripts.shell_scripts) == [
+            "build.sh",
+            "env.bash",
+        ]
+        assert "./env.bash" in analyzer.profile.script_commands
+
+    def test_shell_script_suffix_case_insensitive_on_windows(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Upper-case suffixes match when the platform ignores case."""
+        (temp_dir / "SETUP.SH").write_text("#!/bin/sh\n")
+        (temp_dir / "Deploy.Bash").write_text("#!/bin/bash\n")
+        monkeypatch.setattr(config_parser.os.path, "normcase", ntpath.normcase)
+
+        names = ConfigParser(temp_dir).glob_files_multi((".sh", ".bash"))
+
+        assert sorted(names) == ["Deploy.Bash", "SETUP.SH"]
+
 
 class TestCustomAllowlist:
     """Tests for custom allowlist loading."""
@@ -447,6 +498,184 @@ another-command
         assert "my-custom-tool" in analyzer.profile.custom_commands
         assert "another-command" in analyzer.profile.custom_commands
 
+    def test_allowlist_strips_whitespace_and_skips_comments(self, temp_dir: Path):
+        """Indented comments and blank lines are ignored, entries are stripped."""
+        allowlist = "  spaced-tool  \n\t# indented comment\n   \n\nlast-tool"
+        (temp_dir / ".auto-claude-allowlist").write_text(allowlist)
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._load_custom_allowlist()
+
+        assert analyzer.profile.custom_commands == {"spaced-tool", "last-tool"}
+
+    def test_allowlist_strips_non_ascii_whitespace(self, temp_dir: Path):
+        """Entries padded with other whitespace are stripped, not dropped."""
+        allowlist = "\xa0tool\n\x0btool2\nx\xa0\ntool3\x0c\n\xa0# comment\n"
+        (temp_dir / ".auto-claude-allowlist").write_text(allowlist, encoding="utf-8")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._load_custom_allowlist()
+
+        assert analyzer.profile.custom_commands == {"tool", "tool2", "x", "tool3"}
+
+    def test_allowlist_splits_on_all_line_boundaries(self, temp_dir: Path):
+        """Form feeds, separators and Unicode line breaks end an entry."""
+        allowlist = "a\x0cb\x1cc\x85d\u2028e\u2029# note\x0bf"
+        (temp_dir / ".auto-claude-allowlist").write_text(allowlist, encoding="utf-8")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._load_custom_allowlist()
+
+        assert analyzer.profile.custom_commands == {"a", "b", "c", "d", "e", "f"}
+
+    def test_allowlist_entries_with_colons_kept_whole(self, temp_dir: Path):
+        """Entries that look like Makefile targets are not truncated."""
+        (temp_dir / ".auto-claude-allowlist").write_text("docker:build\nnpx tsc\n")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._load_custom_allowlist()
+
+        assert analyzer.profile.custom_commands == {"docker:build", "npx tsc"}
+        assert analyzer.profile.custom_scripts.make_targets == []
+
+
+class TestConfigParser:
+    """Tests for config file parsing."""
+
+    def test_reuses_parse_until_file_changes(self, temp_dir: Path):
+        """Unchanged files are served from cache, changed files are re-parsed."""
+        pkg_path = temp_dir / "package.json"
+        pkg_path.write_text(json.dumps({"name": "app"}))
+
+        first = ConfigParser(temp_dir).read_json("package.json")
+        assert first == {"name": "app"}
+        # Detectors build a new parser per call; the cache is shared by all
+        assert ConfigParser(temp_dir).read_json("package.json") is first
+
+        pkg_path.write_text(json.dumps({"name": "renamed-app"}))
+        assert ConfigParser(temp_dir).read_json("package.json") == {
+            "name": "renamed-app"
+        }
+
+    def test_missing_and_invalid_files(self, temp_dir: Path):
+        """Missing or malformed files return None."""
+        (temp_dir / "pyproject.toml").write_text("[project\n")
+        parser = ConfigParser(temp_dir)
+
+        assert parser.read_json("package.json") is None
+        assert parser.read_toml("pyproject.toml") is None
+
+
+class TestSecurityDefaults:
+    """Tests for .auto-claude/security_defaults.json loading.
+
+    Every test runs once per decoder path: stdlib json, orjson and msgspec
+    (the optional ones are skipped when not installed).
+    """
+
+    @pytest.fixture(autouse=True, params=["json", "orjson", "msgspec"])
+    def decoder(self, request, monkeypatch):
+        """Force the security defaults decoder path under test."""
+        if request.param == "json":
+            monkeypatch.setattr(structure_analyzer, "msgspec", None)
+            monkeypatch.setattr(structure_analyzer, "_json_loads", json.loads)
+        elif request.param == "orjson":
+            orjson = pytest.importorskip("orjson")
+            monkeypatch.setattr(structure_analyzer, "msgspec", None)
+            monkeypatch.setattr(structure_analyzer, "_json_loads", orjson.loads)
+        else:
+            pytest.importorskip("msgspec")
+            if structure_analyzer.msgspec is None:
+                pytest.skip("msgspec was not importable when the module loaded")
+        return request.param
+
+    def _write_defaults(self, project_dir: Path, data: dict) -> Path:
+        defaults_path = project_dir / ".auto-claude" / "security_defaults.json"
+        defaults_path.parent.mkdir(exist_ok=True)
+        defaults_path.write_text(json.dumps(data))
+        return defaults_path
+
+    def test_loads_security_defaults(self, temp_dir: Path):
+        """Loads scripts and validation command heads from defaults."""
+        self._write_defaults(
+            temp_dir,
+            {
+                "custom_scripts": {
+                    "make_targets": ["build", "test"],
+                    "mise_tasks": ["mise run all"],
+                },
+                "validation_commands": {
+                    "go": {"build": "go build ./...", "vet": "golangci-lint run"},
+                    "node": {"lint": "  eslint\t.", "noop": "   ", "empty": ""},
+                    "ignored": "not-a-dict",
+                },
+            },
+        )
+
+        scripts, script_commands, custom_commands = StructureAnalyzer(
+            temp_dir
+        ).analyze()
+
+        assert scripts.make_targets == ["build", "test"]
+        assert scripts.mise_tasks == ["mise run all"]
+        assert {"make", "mise"} <= script_commands
+        assert custom_commands == {"go", "golangci-lint", "eslint"}
+
+    def test_security_defaults_merge_without_duplicates(self, temp_dir: Path):
+        """Defaults already detected from the Makefile are not added twice."""
+        (temp_dir / "Makefile").write_text("build:\n\tgo build\n")
+        self._write_defaults(
+            temp_dir, {"custom_scripts": {"make_targets": ["build", "lint", "lint"]}}
+        )
+
+        scripts, _, _ = StructureAnalyzer(temp_dir).analyze()
+
+        assert scripts.make_targets == ["build", "lint"]
+
+    def test_security_defaults_with_utf8_bom(self, temp_dir: Path):
+        """A UTF-8 BOM is accepted by every decoder."""
+        defaults_path = temp_dir / ".auto-claude" / "security_defaults.json"
+        defaults_path.parent.mkdir()
+        defaults_path.write_bytes(
+            codecs.BOM_UTF8
+            + json.dumps({"custom_scripts": {"make_targets": ["build"]}}).encode()
+        )
+
+        scripts, script_commands, _ = StructureAnalyzer(temp_dir).analyze()
+
+        assert scripts.make_targets == ["build"]
+        assert "make" in script_commands
+
+    def test_malformed_security_defaults_ignored(self, temp_dir: Path):
+        """A malformed defaults file is skipped without raising."""
+        defaults_path = temp_dir / ".auto-claude" / "security_defaults.json"
+        defaults_path.parent.mkdir()
+        defaults_path.write_text("{not json")
+
+        scripts, _, custom_commands = StructureAnalyzer(temp_dir).analyze()
+
+        assert scripts.make_targets == []
+        assert custom_commands == set()
+
+    def test_security_defaults_reloaded_after_change(self, temp_dir: Path):
+        """A modified defaults file is re-parsed instead of served from cache."""
+        defaults_path = self._write_defaults(
+            temp_dir, {"custom_scripts": {"make_targets": ["build"]}}
+        )
+        scripts, _, _ = StructureAnalyzer(temp_dir).analyze()
+        assert scripts.make_targets == ["build"]
+
+        defaults_path.write_text(
+            json.dumps({"custom_scripts": {"make_targets": ["build", "lint"]}})
+        )
+        scripts, _, _ = StructureAnalyzer(temp_dir).analyze()
+        assert scripts.make_targets == ["build", "lint"]
+
+        # The edit replaced the cached entry rather than adding another one
+        project_root = str(temp_dir.resolve())
+        entries = [k for k in _SEC_DEFAULTS_CACHE if k.startswith(project_root)]
+        assert len(entries) == 1
+
 
 class TestSecurityProfileGeneration:
     """Tests for complete security profile generation."""